@@ -6,81 +6,341 @@ computer and discuss what's on the screen.
 Use the shortcut Ctrl+Shift+O to start talking to your computer.
 """
 
+from __future__ import annotations
+
 import os
 import sys
+import functools
 import logging
-from typing import Optional
+from enum import IntEnum
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Optional
 
 import base64
-import math
-import requests
+import hashlib
+import random
+import sqlite3
+import threading
+import time
+import orjson
 from dotenv import load_dotenv
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QPainter, QBrush, QPen, QColor, QKeySequence, QPainterPath
-from PyQt5.QtWidgets import QApplication, QWidget, QPushButton, QShortcut, QMessageBox
-from mss import mss
-from PIL import Image
+from PyQt5.QtCore import (
+    Qt, QRect, QObject, QRunnable, QThreadPool, QPropertyAnimation, QSequentialAnimationGroup,
+    QEasingCurve, pyqtProperty, pyqtSignal, pyqtSlot,
+)
+from PyQt5.QtGui import QPainter, QBrush, QPen, QKeySequence
+from PyQt5.QtWidgets import QApplication, QWidget, QShortcut, QMessageBox
 
-from vapi_python import Vapi
+# Heavy dependencies are imported where they are first used, so the window
+# appears without waiting on them
+if TYPE_CHECKING:
+    import httpx
+    import numpy as np
+    from turbojpeg import TurboJPEG
+    from vapi_python import Vapi
 
 # Set up logging
 logging.basicConfig(format='%(asctime)s - %(levelname)s - %(message)s', level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_dotenv_loaded = False
+
+def load_environment():
+    """Load variables from .env into the environment, only once per process."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
 class Config:
     def __init__(self):
-        load_dotenv()
+        load_environment()
         self.openai_api_key = os.getenv('OPENAI_API_KEY')
         self.vapi_api_key = os.getenv('VAPI_API_KEY')
         self.vapi_assistant_id = os.getenv("VAPI_ASSISTANT_ID", "ea8c30ba-4efb-4b3a-b3fa-9cd37a821300")
+        # Also write each capture to disk, useful when debugging OCR output
+        self.save_screenshot = os.getenv('SAVE_SCREENSHOT', '').lower() in ('1', 'true', 'yes')
+        # Longest edge, in pixels, of the image sent for OCR
+        self.ocr_max_edge = os.getenv('OCR_MAX_EDGE', '1568')
         self.validate()
     
     def validate(self):
+        errors = []
         missing_vars = []
         for var in ['openai_api_key', 'vapi_api_key']:
             if not getattr(self, var):
                 missing_vars.append(var)
         
         if missing_vars:
-            error_msg = f"Missing environment variables: {', '.join(missing_vars)}"
+            errors.append(f"Missing environment variables: {', '.join(missing_vars)}")
+
+        try:
+            self.ocr_max_edge = int(self.ocr_max_edge)
+        except ValueError:
+            self.ocr_max_edge = 0
+        if self.ocr_max_edge <= 0:
+            errors.append("OCR_MAX_EDGE must be a positive integer")
+
+        if errors:
+            error_msg = "\n".join(errors)
             logger.error(error_msg)
             QMessageBox.critical(None, "Configuration Error", error_msg)
             sys.exit(1)
 
+@functools.lru_cache(maxsize=None)
+def get_config() -> Config:
+    """Return the shared Config, creating it on first use."""
+    return Config()
+
 # Instantiate config
-config = Config()
+config = get_config()
+
+@functools.lru_cache(maxsize=None)
+def get_client() -> httpx.Client:
+    """Return the shared HTTP/2 client that keeps connections to the OpenAI API alive."""
+    import httpx
+
+    # Only retry failed connections here; OCRProcessor handles retryable responses
+    transport = httpx.HTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+    )
+    return httpx.Client(transport=transport, timeout=httpx.Timeout(60.0, connect=5.0))
+
+@functools.lru_cache(maxsize=None)
+def get_jpeg_encoder() -> TurboJPEG:
+    """Return the shared libjpeg-turbo encoder."""
+    from turbojpeg import TurboJPEG
+    return TurboJPEG()
+
+@functools.lru_cache(maxsize=None)
+def get_gpu_jpeg_encoder():
+    """Return the shared nvJPEG encoder, or None when pynvjpeg or a CUDA device is unavailable."""
+    try:
+        # Optional GPU JPEG encoder (pynvjpeg), only useful with an NVIDIA GPU
+        from nvjpeg import NvJpeg
+    except ImportError:
+        return None
+    try:
+        encoder = NvJpeg()
+    except Exception as e:
+        logger.info(f"nvJPEG unavailable, using libjpeg-turbo: {e}")
+        return None
+    logger.info("Using nvJPEG for GPU JPEG encoding")
+    return encoder
 
 class ScreenCapture:
+    # Monitors are encoded in parallel; serialize access to the GPU encoder
+    gpu_lock = threading.Lock()
+
     @staticmethod
-    def capture_and_save():
-        """Take a screenshot using mss and save it."""
-        screenshot_path = os.path.join(os.getcwd(), 'screenshot.jpg')
+    def downscale(frame: np.ndarray, max_edge: int) -> np.ndarray:
+        """Shrink the BGRA frame so its longest edge is at most max_edge pixels."""
+        height, width = frame.shape[:2]
+        if max(height, width) <= max_edge:
+            return frame
+        import numpy as np
+        from PIL import Image
+
+        # Wrap the buffer without copying; channel order doesn't matter for resampling,
+        # and RGBX avoids the alpha premultiplication PIL applies to RGBA
+        img = Image.frombuffer('RGBX', (width, height), frame, 'raw', 'RGBX', 0, 1)
+        img.thumbnail((max_edge, max_edge), Image.BILINEAR)
+        return np.asarray(img)
+
+    @classmethod
+    def encode(cls, frame: np.ndarray) -> bytes:
+        """Encode a BGRA frame as JPEG, on the GPU when nvJPEG is available."""
+        import numpy as np
+        from turbojpeg import TJPF_BGRA, TJSAMP_420
+
+        gpu_jpeg_encoder = get_gpu_jpeg_encoder()
+        if gpu_jpeg_encoder is not None:
+            try:
+                # nvJPEG takes 3-channel BGR input
+                bgr = np.ascontiguousarray(frame[:, :, :3])
+                with cls.gpu_lock:
+                    return gpu_jpeg_encoder.encode(bgr, 75)
+            except Exception as e:
+                logger.warning(f"nvJPEG encoding failed, falling back to libjpeg-turbo: {e}")
+        return get_jpeg_encoder().encode(
+            frame, quality=75, pixel_format=TJPF_BGRA, jpeg_subsample=TJSAMP_420
+        )
+
+    @classmethod
+    def process_monitor(cls, sct_img) -> bytes:
+        """Downscale and encode one grabbed monitor as JPEG; safe to call from worker threads."""
+        import numpy as np
+
+        # View the raw BGRA buffer as an array without copying
+        frame = np.frombuffer(sct_img.raw, np.uint8).reshape(sct_img.height, sct_img.width, 4)
+
+        # The model rescales large images anyway, so avoid uploading full resolution
+        frame = cls.downscale(frame, config.ocr_max_edge)
+
+        # Encode as JPEG in memory
+        return cls.encode(frame)
+
+    @classmethod
+    def capture(cls) -> Optional[List[bytes]]:
+        """Take a screenshot of every monitor using mss and return them as JPEG bytes."""
         try:
+            from mss import mss
+
+            # Create the shared encoders before the per-monitor threads race to do so
+            get_jpeg_encoder()
+            get_gpu_jpeg_encoder()
+
             with mss() as sct:
-                # Capture entire screen
-                monitor = sct.monitors[0]
-                sct_img = sct.grab(monitor)
-                
-                # Convert to PIL Image
-                img = Image.frombytes('RGB', sct_img.size, sct_img.bgra, 'raw', 'BGRX')
-                
-                # Save as JPEG
-                img.save(screenshot_path, 'JPEG')
-            
-            logger.info(f"Screenshot saved to {screenshot_path}")
-            return screenshot_path
+                # Index 0 is the union of all monitors; grab each physical monitor instead.
+                # mss serializes grabs internally, so one instance grabs them in turn
+                sct_imgs = [sct.grab(monitor) for monitor in sct.monitors[1:]]
+
+            if not sct_imgs:
+                # Some headless and Wayland sessions expose no physical monitors
+                logger.error("No monitors found. Unable to take a screenshot.")
+                return None
+
+            # PIL resampling and TurboJPEG release the GIL, so monitors are encoded in parallel
+            with ThreadPoolExecutor(max_workers=len(sct_imgs)) as executor:
+                jpeg_images = list(executor.map(cls.process_monitor, sct_imgs))
+
+            if config.save_screenshot:
+                for index, jpeg_bytes in enumerate(jpeg_images):
+                    screenshot_path = os.path.join(os.getcwd(), f'screenshot-{index + 1}.jpg')
+                    with open(screenshot_path, 'wb') as screenshot_file:
+                        screenshot_file.write(jpeg_bytes)
+                    logger.info(f"Screenshot saved to {screenshot_path}")
+
+            logger.info(f"Captured {len(jpeg_images)} monitor(s) ({sum(map(len, jpeg_images))} bytes)")
+            return jpeg_images
         except Exception as e:
             logger.error(f"Error taking screenshot: {e}")
             return None
 
+class OCRCache:
+    """Persistent LRU cache of OCR results keyed by a hash of the request and JPEG images."""
+    DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'screen-ai', 'ocr.sqlite')
+
+    def __init__(self, path: str = DEFAULT_PATH, max_entries: int = 500):
+        self.path = path
+        self.max_entries = max_entries
+
+    @contextmanager
+    def connect(self):
+        """Open a connection for a single transaction; the worker thread varies per call."""
+        # Cached results are transcribed screen contents, so keep them private to the user
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        try:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS ocr_cache "
+                    "(key TEXT PRIMARY KEY, content TEXT NOT NULL, last_used REAL NOT NULL)"
+                )
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def key(request: bytes, jpeg_images: List[bytes]) -> str:
+        """Hash the serialized request (model, prompt, image count) together with the images."""
+        digest = hashlib.sha256()
+        for part in (request, *jpeg_images):
+            # Length-prefix each part so different splits never collide
+            digest.update(len(part).to_bytes(8, 'little'))
+            digest.update(part)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached OCR result for key, or None on a miss."""
+        try:
+            with self.connect() as conn:
+                row = conn.execute("SELECT content FROM ocr_cache WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                conn.execute("UPDATE ocr_cache SET last_used = ? WHERE key = ?", (time.time(), key))
+                return row[0]
+        except sqlite3.Error as e:
+            logger.warning(f"Error reading OCR cache: {e}")
+            return None
+
+    def put(self, key: str, content: str):
+        """Store an OCR result and evict the least recently used entries."""
+        try:
+            with self.connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO ocr_cache (key, content, last_used) VALUES (?, ?, ?)",
+                    (key, content, time.time()),
+                )
+                conn.execute(
+                    "DELETE FROM ocr_cache WHERE key NOT IN "
+                    "(SELECT key FROM ocr_cache ORDER BY last_used DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Error writing OCR cache: {e}")
+
 class OCRProcessor:
+    cache = OCRCache()
+    # Stand-in for the image data URL while the rest of the payload is serialized
+    IMAGE_PLACEHOLDER = "__SCREEN_AI_IMAGE__"
+    RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+    MAX_ATTEMPTS = 4
+    MAX_RETRY_DELAY = 30.0
+
+    @classmethod
+    def retry_delay(cls, response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying, honoring Retry-After when the server sends it."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return min(cls.MAX_RETRY_DELAY, max(0.0, float(retry_after)))
+            except ValueError:
+                pass  # HTTP-date form; fall back to exponential backoff
+        return min(cls.MAX_RETRY_DELAY, 0.5 * 2 ** attempt) + random.uniform(0, 0.25)
+
     @staticmethod
-    def process(screenshot_path: str) -> Optional[str]:
-        """Perform OCR on the screenshot using OpenAI's API."""
+    def read_stream(response: httpx.Response) -> str:
+        """Accumulate the text deltas of a streamed chat completion."""
+        pieces = []
+        for line in response.iter_lines():
+            if not line.startswith("data: "):
+                continue
+            data = line[len("data: "):]
+            if data == "[DONE]":
+                break
+            choices = orjson.loads(data)['choices']
+            delta = choices[0]['delta'].get('content') if choices else None
+            if delta:
+                if not pieces:
+                    logger.info("Receiving OCR result...")
+                pieces.append(delta)
+        return "".join(pieces)
+
+    @classmethod
+    def stream_completion(cls, url: str, headers: dict, body: bytes) -> str:
+        """POST a streaming request to the OpenAI API, backing off on rate limits and server errors."""
+        for attempt in range(cls.MAX_ATTEMPTS):
+            with get_client().stream("POST", url, headers=headers, content=body) as response:
+                if response.status_code not in cls.RETRYABLE_STATUS_CODES or attempt == cls.MAX_ATTEMPTS - 1:
+                    # Success, a non-retryable error such as 400/401, or out of attempts
+                    if response.is_error:
+                        response.read()
+                    response.raise_for_status()
+                    return cls.read_stream(response)
+                delay = cls.retry_delay(response, attempt)
+            logger.warning(f"OpenAI returned {response.status_code}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+        # The final attempt always returns or raises above
+        raise AssertionError("unreachable")
+
+    @classmethod
+    def process(cls, jpeg_images: List[bytes]) -> Optional[str]:
+        """Perform OCR on the JPEG screenshots, one per monitor, using OpenAI's API."""
         try:
-            with open(screenshot_path, 'rb') as image_file:
-                encoded_image = base64.b64encode(image_file.read()).decode('utf-8')
-                
             headers = {
                 "Content-Type": "application/json",
                 "Authorization": f"Bearer {config.openai_api_key}"
@@ -93,33 +353,114 @@ class OCRProcessor:
                         "content": [
                             {
                                 "type": "text",
-                                "text": "Give a summary of what's in the image after 'SUMMARY:' "
-                                        "and give full OCR exactly and correctly without any "
-                                        "missing details after 'OCR:'"
+                                "text": "The attached images are screenshots of the user's screen, "
+                                        "one per monitor, in order. Give a summary of what's in "
+                                        "all of them after 'SUMMARY:' and give full OCR of every "
+                                        "screenshot, labelled by monitor number, exactly and "
+                                        "correctly without any missing details after 'OCR:'"
                             },
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/jpeg;base64,{encoded_image}"
+                            *(
+                                {
+                                    "type": "image_url",
+                                    "image_url": {
+                                        "url": cls.IMAGE_PLACEHOLDER
+                                    }
                                 }
-                            }
+                                for _ in jpeg_images
+                            )
                         ]
                     }
                 ],
-                "max_tokens": 300
+                # Each monitor gets the token budget a single screenshot had
+                "max_tokens": 300 * len(jpeg_images),
+                "stream": True
             }
 
-            response = requests.post("https://api.openai.com/v1/chat/completions", headers=headers, json=payload)
-            response.raise_for_status()
+            request = orjson.dumps(payload)
+
+            # A changed model, prompt or image count must not reuse older answers
+            cache_key = cls.cache.key(request, jpeg_images)
+            cached = cls.cache.get(cache_key)
+            if cached is not None:
+                logger.info("OCR cache hit, skipping OpenAI request")
+                return cached
+
+            # Splice the base64 bytes into the serialized payload so the image
+            # is never decoded to str or re-encoded by the JSON serializer.
+            # The base64 alphabet needs no JSON escaping.
+            encoded_images = [base64.b64encode(jpeg_bytes) for jpeg_bytes in jpeg_images]
+            parts = request.split(cls.IMAGE_PLACEHOLDER.encode('ascii'))
+            chunks = [parts[0]]
+            for encoded_image, part in zip(encoded_images, parts[1:]):
+                chunks.extend((b"data:image/jpeg;base64,", encoded_image, part))
+            body = b"".join(chunks)
+            del encoded_images, chunks
+
+            content = cls.stream_completion("https://api.openai.com/v1/chat/completions", headers, body)
             logger.info("OCR processing completed successfully")
-            return response.json()['choices'][0]['message']['content']
+            if content:
+                cls.cache.put(cache_key, content)
+            return content
         except Exception as e:
             logger.error(f"Error performing OCR: {e}")
             return None
 
+class OCRWorkerSignals(QObject):
+    # Emits the OCR text once Vapi has started, or None if capture, OCR or Vapi failed
+    finished = pyqtSignal(object)
+
+class OCRWorker(QRunnable):
+    def __init__(self, screen_capture: ScreenCapture, ocr_processor: OCRProcessor, vapi_assistant: VapiManager):
+        super().__init__()
+        self.screen_capture = screen_capture
+        self.ocr_processor = ocr_processor
+        self.vapi_assistant = vapi_assistant
+        self.signals = OCRWorkerSignals()
+
+    def run(self):
+        """Take a screenshot, perform OCR and start Vapi off the GUI thread."""
+        jpeg_images = self.screen_capture.capture()
+        if not jpeg_images:
+            logger.error("Failed to take screenshot. Unable to proceed.")
+            self.signals.finished.emit(None)
+            return
+        screen_data = self.ocr_processor.process(jpeg_images)
+        if not screen_data:
+            logger.error("OCR failed. Unable to start Vapi.")
+            self.signals.finished.emit(None)
+            return
+        logger.info(f"OCR Result:\n{screen_data}")
+        try:
+            # Creating the web call and opening the audio devices both block
+            self.vapi_assistant.start(screen_data)
+        except Exception as e:
+            logger.error(f"Error starting Vapi: {e}")
+            self.signals.finished.emit(None)
+            return
+        self.signals.finished.emit(screen_data)
+
 class VapiManager:
     def __init__(self):
-        self.vapi = Vapi(api_key=config.vapi_api_key)
+        # Importing vapi_python loads the Daily WebRTC stack, so it is created off the GUI thread
+        self.vapi: Optional[Vapi] = None
+        self.vapi_lock = threading.Lock()
+        threading.Thread(target=self.prewarm, daemon=True).start()
+
+    def get_vapi(self) -> Vapi:
+        """Return the Vapi client, creating it on first use."""
+        with self.vapi_lock:
+            if self.vapi is None:
+                from vapi_python import Vapi
+                self.vapi = Vapi(api_key=config.vapi_api_key)
+            return self.vapi
+
+    def prewarm(self):
+        """Load the Vapi SDK and create the client while the user is idle."""
+        try:
+            self.get_vapi()
+            logger.info("Vapi SDK loaded")
+        except Exception as e:
+            logger.warning(f"Error pre-warming Vapi: {e}")
 
     def start(self, screen_data: str):
         """Start the Vapi assistant with the given screen data."""
@@ -129,13 +470,28 @@ class VapiManager:
             }
         }
         logger.info("Starting Vapi assistant")
-        self.vapi.start(assistant_id=config.vapi_assistant_id, assistant_overrides=assistant_overrides)
+        # Runs on the OCR worker, so waiting for an unfinished pre-warm never blocks the GUI
+        self.get_vapi().start(assistant_id=config.vapi_assistant_id, assistant_overrides=assistant_overrides)
+
+class State(IntEnum):
+    IDLE = 0
+    LOADING = 1
+    TALKING = 2
 
 class UIManager:
+    CIRCLE_RADIUS = 120.0
+    PULSE_RADIUS = 140.0
+    # Duration in ms of one grow or shrink half of the pulse
+    PULSE_DURATION = 1000
+    # Bounding box of the circle at its largest: centre 150 +/- (70 radius + 4 half pen + 1 antialiasing)
+    DIRTY_RECT = QRect(75, 75, 151, 151)
+
     def __init__(self, parent):
         self.parent = parent
-        self.pulse_timer: Optional[QTimer] = None
-        self.pulse_frame: int = 0
+        self.pulse_animation: Optional[QSequentialAnimationGroup] = None
+        # Painting runs on every animation frame while talking, so build these once
+        self.pen = QPen(Qt.black, 8, Qt.SolidLine)
+        self.brush = QBrush(Qt.black, Qt.SolidPattern)
 
     def setup(self):
         """Initialize the user interface components."""
@@ -151,72 +507,89 @@ class UIManager:
     def paint(self, painter: QPainter):
         """Handle the paint event to draw the UI."""
         painter.setRenderHint(QPainter.Antialiasing)
-        painter.setPen(QPen(Qt.black, 8, Qt.SolidLine))
-        painter.setBrush(QBrush(Qt.black, Qt.SolidPattern))
+        painter.setPen(self.pen)
+        painter.setBrush(self.brush)
 
         center_x, center_y = 150, 150
-        circle_radius = 120
-
-        if self.parent.state == 'talking':
-            radius_variation = 10 * (1 + math.sin(self.pulse_frame * math.pi / 100))
-            radius = circle_radius + radius_variation
-        else:
-            radius = circle_radius
+        radius = self.parent.pulseRadius
 
         painter.drawEllipse(int(center_x - radius / 2), int(center_y - radius / 2), int(radius), int(radius))
 
-    def update_state(self, new_state: str):
-        """Update the state of the application and manage the pulse timer."""
+    def create_pulse_animation(self) -> QSequentialAnimationGroup:
+        """Build a looping animation that grows and shrinks the parent's pulseRadius."""
+        group = QSequentialAnimationGroup(self.parent)
+        for start, end in ((self.CIRCLE_RADIUS, self.PULSE_RADIUS), (self.PULSE_RADIUS, self.CIRCLE_RADIUS)):
+            animation = QPropertyAnimation(self.parent, b'pulseRadius')
+            animation.setDuration(self.PULSE_DURATION)
+            animation.setStartValue(start)
+            animation.setEndValue(end)
+            animation.setEasingCurve(QEasingCurve.InOutSine)
+            group.addAnimation(animation)
+        group.setLoopCount(-1)
+        return group
+
+    def update_state(self, new_state: State):
+        """Update the state of the application and manage the pulse animation."""
         self.parent.state = new_state
-        if new_state == 'talking':
-            self.pulse_frame = 0
-            self.pulse_timer = QTimer(self.parent)
-            self.pulse_timer.timeout.connect(self.pulse_circle)
-            self.pulse_timer.start(10)
-        elif self.pulse_timer is not None:
-            self.pulse_timer.stop()
-            self.pulse_timer = None
-        self.parent.update()
-        logger.info(f"Application state updated to: {new_state}")
-
-    def pulse_circle(self):
-        """Update the pulse frame and trigger a repaint."""
-        self.pulse_frame = (self.pulse_frame + 1) % 200
-        self.parent.update()
+        if self.pulse_animation is not None:
+            self.pulse_animation.stop()
+            # The group is owned by the parent widget, so dropping the reference doesn't free it
+            self.pulse_animation.deleteLater()
+            self.pulse_animation = None
+            self.parent.pulseRadius = self.CIRCLE_RADIUS
+        if new_state is State.TALKING:
+            self.pulse_animation = self.create_pulse_animation()
+            self.pulse_animation.start()
+        self.parent.update(self.DIRTY_RECT)
+        logger.info(f"Application state updated to: {new_state.name.lower()}")
 
 class ScreenAI(QWidget):
     def __init__(self):
         super().__init__()
-        self.state: str = 'idle'  # Possible states: 'loading', 'talking', 'idle'
+        self.state: State = State.IDLE
+        self._pulse_radius: float = UIManager.CIRCLE_RADIUS
         self.ui_controller = UIManager(self)
         self.screen_capture = ScreenCapture()
         self.ocr_processor = OCRProcessor()
         self.vapi_assistant = VapiManager()
+        self.thread_pool = QThreadPool.globalInstance()
         self.ui_controller.setup()
         logger.info("ScreenAI initialized")
 
+    def get_pulse_radius(self) -> float:
+        return self._pulse_radius
+
+    def set_pulse_radius(self, radius: float):
+        self._pulse_radius = radius
+        self.update(UIManager.DIRTY_RECT)
+
+    # Animated by UIManager while talking; Qt drives it at the display's frame rate
+    pulseRadius = pyqtProperty(float, fget=get_pulse_radius, fset=set_pulse_radius)
+
     def paintEvent(self, event):
         """Handle the paint event to draw the UI."""
         painter = QPainter(self)
+        painter.setClipRect(event.rect())
         self.ui_controller.paint(painter)
 
     def capture_and_process(self):
-        """Take a screenshot, perform OCR, and start Vapi."""
+        """Take a screenshot, perform OCR and start Vapi in the background."""
+        if self.state is State.LOADING:
+            logger.info("OCR already in progress, ignoring shortcut")
+            return
         logger.info("Starting OCR process...")
-        self.ui_controller.update_state('loading')
-        screenshot_path = self.screen_capture.capture_and_save()
-        if screenshot_path:
-            screen_data = self.ocr_processor.process(screenshot_path)
-            if screen_data:
-                self.ui_controller.update_state('talking')
-                self.vapi_assistant.start(screen_data)
-                logger.info(f"OCR Result:\n{screen_data}")
-            else:
-                logger.error("OCR failed. Unable to start Vapi.")
-                self.ui_controller.update_state('idle')
+        self.ui_controller.update_state(State.LOADING)
+        worker = OCRWorker(self.screen_capture, self.ocr_processor, self.vapi_assistant)
+        worker.signals.finished.connect(self.on_ocr_done)
+        self.thread_pool.start(worker)
+
+    @pyqtSlot(object)
+    def on_ocr_done(self, screen_data: Optional[str]):
+        """Update the state once the worker finishes; runs on the GUI thread."""
+        if screen_data:
+            self.ui_controller.update_state(State.TALKING)
         else:
-            logger.error("Failed to take screenshot. Unable to proceed.")
-            self.ui_controller.update_state('idle')
+            self.ui_controller.update_state(State.IDLE)
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)